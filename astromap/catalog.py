@@ -1,30 +1,67 @@
-from operator import attrgetter
+from mmap import mmap
 from pathlib import Path
-from typing import Iterator, TextIO
+from typing import BinaryIO, Iterator, Sequence, TextIO
 
-from astromap.star import BrightStar, star_from_catalog
+import numpy as np
+
+from astromap.star import BrightStar, stars_from_catalog
 
 
 class BrightStarCatalog:
     """
     catalog of bright stars from the yale bright star catalog
+
+    - table may be opened in text or binary mode, or be memory mapped
     """
 
-    def __init__(self, table: TextIO) -> None:
-        self._stars: dict[int, BrightStar] = {}
+    def __init__(self, table: TextIO | BinaryIO | mmap) -> None:
+        # mmap isn't iterable by line, but its readline is faster than
+        # iterating a file
+        rows: Sequence[str | bytes] = (
+            list(iter(table.readline, b""))
+            if isinstance(table, mmap)
+            else list(table)
+        )
+        self._stars: dict[int, BrightStar] = {
+            star.number: star for star in stars_from_catalog(rows)
+        }
+
+        # parallel arrays of star attributes in catalog order
+        stars: list[BrightStar] = list(self._stars.values())
+        count: int = len(stars)
+        numbers: np.ndarray = np.fromiter(
+            (star.number for star in stars), dtype=np.int32, count=count
+        )
+        magnitudes: np.ndarray = np.fromiter(
+            (star.magnitude for star in stars), dtype=np.float64, count=count
+        )
+        azimuths: np.ndarray = np.fromiter(
+            (star.coords.azimuth for star in stars),
+            dtype=np.float64,
+            count=count,
+        )
+        zeniths: np.ndarray = np.fromiter(
+            (star.coords.zenith for star in stars),
+            dtype=np.float64,
+            count=count,
+        )
 
-        for row in table:
-            star = star_from_catalog(row)
-            if star is not None:
-                self._stars[star.number] = star
+        # rank by magnitude, stars of equal magnitude by catalog number
+        order: np.ndarray = np.lexsort((numbers, magnitudes))
+        self._numbers_sorted: np.ndarray = numbers[order]
+        self._mags_sorted: np.ndarray = magnitudes[order]
+        self._azimuths_sorted: np.ndarray = azimuths[order]
+        self._zeniths_sorted: np.ndarray = zeniths[order]
 
-        self._magnitudes: list[tuple[float, int]] = [
-            (star.magnitude, star.number)
-            for star in sorted(
-                self._stars.values(), key=attrgetter("magnitude")
-            )
+        # stars ranked by magnitude, for direct lookup by rank
+        self._ranked: list[BrightStar] = [
+            self._stars[number] for number in self._numbers_sorted.tolist()
         ]
 
+        # zenith is fixed per star, so its sine & cosine are computed once
+        self._zn_sin_sorted: np.ndarray = np.sin(self._zeniths_sorted)
+        self._zn_cos_sorted: np.ndarray = np.cos(self._zeniths_sorted)
+
     def __getitem__(self, i: int) -> BrightStar:
         return self._stars[i]
 
@@ -35,4 +72,59 @@ class BrightStarCatalog:
         return len(self._stars)
 
     def bright(self, n: int) -> BrightStar:
-        return self._stars[self._magnitudes[n][1]]
+        return self._ranked[n]
+
+    def bright_arrays(
+        self, start: int, stop: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        azimuths, zeniths & magnitudes of the stars ranked start to stop by
+        magnitude, in the same order as bright
+
+        - arrays are views into the catalog & must not be modified
+        """
+        stars: slice = slice(start, stop)
+        return (
+            self._azimuths_sorted[stars],
+            self._zeniths_sorted[stars],
+            self._mags_sorted[stars],
+        )
+
+    def bulk_arrays(
+        self, max_magnitude: float
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        catalog numbers, magnitudes, azimuths & zeniths of all stars at or
+        below max_magnitude, sorted by magnitude
+
+        - arrays are views into the catalog & must not be modified
+        """
+        stars: slice = self.stars_below(max_magnitude)
+        return (
+            self._numbers_sorted[stars],
+            self._mags_sorted[stars],
+            self._azimuths_sorted[stars],
+            self._zeniths_sorted[stars],
+        )
+
+    def zenith_trig(
+        self, max_magnitude: float
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        sine & cosine of zenith of all stars at or below max_magnitude, in
+        the same order as bulk_arrays
+
+        - arrays are views into the catalog & must not be modified
+        """
+        stars: slice = self.stars_below(max_magnitude)
+        return self._zn_sin_sorted[stars], self._zn_cos_sorted[stars]
+
+    def stars_below(self, max_magnitude: float) -> slice:
+        """
+        slice of the magnitude sorted catalog arrays holding all stars at or
+        below max_magnitude
+        """
+        stop: int = int(
+            np.searchsorted(self._mags_sorted, max_magnitude, side="right")
+        )
+        return slice(0, stop)
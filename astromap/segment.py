@@ -18,7 +18,7 @@ shortest distance between them on the unit sphere surface.
 """
 
 from dataclasses import dataclass
-from operator import attrgetter
+from math import acos, cos, sin
 from os import sep
 from typing import Self
 import numpy as np
@@ -27,9 +27,16 @@ from astromap.star import BrightStar
 from astromap.catalog import BrightStarCatalog
 
 
-@dataclass
+@dataclass(slots=True)
 class BrightEdge:
-    index: tuple[int, int]  # indices of this edge into ndarray
+    """
+    edge between two stars
+
+    - edges are ordered by brightness in SkySegmenter's flat edge arrays,
+      so this holds data only and defines no ordering of its own
+    """
+
+    index: tuple[int, int]  # star indices of this edge's vertices
     stars: tuple[int, int]  # catalog numbers of vertex stars
     brightness: float  # brightness metric
     now_bright: float | None  # brightness + rival_brightness
@@ -37,204 +44,135 @@ class BrightEdge:
     rival_brightness: float | None = None
     group: int | None = None  # which group this edge belongs to
 
-    def __lt__(self, other: object) -> bool:
-        if other is None:
-            return True
-        if isinstance(other, self.__class__):
-            if self.now_bright is None:
-                return False
-            if other.now_bright is None:
-                return True
-            return self.now_bright < other.now_bright
-        return NotImplemented
-
-    def __le__(self, other: object) -> bool:
-        if other is None:
-            return True
-        if isinstance(other, self.__class__):
-            if other.now_bright is None:
-                return True
-            if self.now_bright is None:
-                return False
-            return self.now_bright <= other.now_bright
-        return NotImplemented
-
-    def __gt__(self, other: object) -> bool:
-        if other is None:
-            return False
-        if isinstance(other, self.__class__):
-            if other.now_bright is None:
-                return False
-            if self.now_bright is None:
-                return True
-            return self.now_bright > other.now_bright
-        return NotImplemented
-
-    def __ge__(self, other: object) -> bool:
-        if other is None:
-            return False
-        if isinstance(other, self.__class__):
-            if self.now_bright is None:
-                return True
-            if other.now_bright is None:
-                return False
-            return self.now_bright >= other.now_bright
-        return NotImplemented
-
-    def __eq__(self, other: object) -> bool:
-        if other is None:
-            return False
-        if isinstance(other, self.__class__):
-            return self.now_bright == other.now_bright
-        return NotImplemented
-
 
 class SkySegmenter:
     def __init__(self, catalog: BrightStarCatalog) -> None:
         self._catalog: BrightStarCatalog = catalog
 
-        self._magnitude_power: np.float64 = np.float64(2.0)
-        self._distance_power: np.float64 = np.float64(2.0)
-        self._distance_coefficient: np.float64 = np.float64(16.0)
-        self._rival_coefficient: np.float64 = np.float64(16.0)
+        # single precision is ample to rank edges & halves memory traffic
+        self._magnitude_power: np.float32 = np.float32(2.0)
+        self._distance_power: np.float32 = np.float32(2.0)
+        self._distance_coefficient: np.float32 = np.float32(16.0)
+        self._rival_coefficient: np.float32 = np.float32(16.0)
+
+        # catalog number by star index, a view into the catalog
+        self._numbers: np.ndarray = np.empty(0, dtype=np.int32)
 
-        self._numbers: list[int] = []  # catalog number by index into edges
-        self._edges: np.ndarray | None = None
+        # upper triangle edges stored as parallel arrays indexed by edge
+        self._edges_brights: np.ndarray = np.empty(0, dtype=np.float32)
+        self._edges_u: np.ndarray = np.empty(0, dtype=np.int32)
+        self._edges_v: np.ndarray = np.empty(0, dtype=np.int32)
         self._groups: list[set[tuple[int, int]]] = []
         self._members: dict[int, int] = {}  # star_index: group_index
 
     def segment(self, max_magnitude: float = 2.0) -> None:
-        numbers, edges = self._gen_edges(max_magnitude=max_magnitude)
+        numbers, brights, us, vs = self._gen_edges(max_magnitude=max_magnitude)
 
         count: int = len(numbers)
 
         self._numbers = numbers
-        self._edges = edges
+        self._edges_brights = brights
+        self._edges_u = us
+        self._edges_v = vs
         self._groups = []
         self._members = {}
 
-        lonely_stars: set[int] = set([i for i in range(count)])
-
-        while len(lonely_stars) > 0:
-            brightest: tuple[int, ...] = tuple(
-                [
-                    int(i)
-                    for i in np.unravel_index(np.argmin(edges), edges.shape)
-                ]
+        # edges are never re-weighted, so visiting them once in ascending
+        # order of brightness is the same as repeatedly taking the minimum;
+        # a stable sort keeps the lowest edge index first among ties
+        order: np.ndarray = np.argsort(brights, kind="stable")
+
+        lonely_stars: int = count
+        for u, v in zip(us[order].tolist(), vs[order].tolist()):
+            if lonely_stars == 0:
+                break
+
+            u_group: int | None = self._members.get(u)
+            v_group: int | None = self._members.get(v)
+
+            # if both vertices of edge are already in separate groups
+            # dont add this edge to either
+            if (
+                u_group is not None
+                and v_group is not None
+                and u_group != v_group
+            ):
+                continue
+
+            group_index: int | None = (
+                u_group if u_group is not None else v_group
             )
-            assert len(brightest) == 2
-
-            edge: BrightEdge = self._edges[brightest]
-
-            group_index: int | None = None
-            separate_groups: bool = False
-            group: set[tuple[int, int]] = set()
-            for i in brightest:
-
-                # check if either star is already in a group
-                if i in self._members:
-
-                    # if both vertices of edge are already in separate groups
-                    # dont add this edge to either
-                    if group_index is not None:
-                        if group_index != self._members[i]:
-                            separate_groups = True
-
-                    group_index = self._members[i]
-
-            edge.now_bright = None
-            if not separate_groups:
-
-                if group_index is None:
-                    group_index = len(self._groups)
-                    self._groups.append(group)
-                else:
-                    group = self._groups[group_index]
-
-                group.add(brightest)
-                edge.group = group_index
-
-                # remove stars from lonely stars set 
-                # & add group to members index
-                for i in brightest:
+            if group_index is None:
+                group_index = len(self._groups)
+                self._groups.append(set())
 
-                    # remove both vertices from lonely stars set
-                    lonely_stars.discard(i)
-                    self._members[i] = group_index
+            self._groups[group_index].add((u, v))
 
+            # remove vertices from lonely stars & add group to members index
+            if u_group is None:
+                lonely_stars -= 1
+                self._members[u] = group_index
+            if v_group is None:
+                lonely_stars -= 1
+                self._members[v] = group_index
 
     def _gen_edges(
         self, max_magnitude: float = 2.0
-    ) -> tuple[list[int], np.ndarray]:
-        # get list of stars below given magnitude & sorted by magnitude
-        stars = sorted(
-            [star for star in self._catalog if star.magnitude <= max_magnitude],
-            key=attrgetter("magnitude"),
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        # views of stars below given magnitude, sorted by magnitude
+        numbers, star_magnitudes, star_azimuths, _ = self._catalog.bulk_arrays(
+            max_magnitude
         )
-        count = len(stars)
-
-        # break up star attributes into a list of star #s & two numpy arrays
-        numbers: list[int] = [star.number for star in stars]
-        magnitudes = np.array(
-            [star.magnitude + 1.5 for star in stars], dtype=float
-        )
-        coords = np.array(
-            [[star.coords.azimuth, star.coords.zenith] for star in stars],
-            dtype=float,
+        star_zn_sin, star_zn_cos = self._catalog.zenith_trig(max_magnitude)
+        count = len(numbers)
+
+        azimuths = star_azimuths.astype(np.float32)
+        mags = star_magnitudes.astype(np.float32) + 1.5
+        zn_sin = star_zn_sin.astype(np.float32)
+        zn_cos = star_zn_cos.astype(np.float32)
+
+        # only the upper triangle (u < v) is computed, as flat edge arrays;
+        # edges are laid out row by row, so star u repeats once per partner
+        partners = np.arange(count - 1, -1, -1)
+        starts = np.cumsum(partners) - partners  # first edge of each row
+        us = np.repeat(np.arange(count), partners)
+        vs = np.arange(len(us)) - np.repeat(
+            starts - np.arange(count) - 1, partners
         )
 
-        # vectorized calculation of pairwise magnitude
-        mags = magnitudes.reshape(1, magnitudes.size)
-        pairwise_magnitudes = mags + mags.T
-
         # vectorized calculation of distance
-        azimuths = coords[:, 0].reshape(1, count)
-        zeniths = coords[:, 1].reshape(1, count)
-
-        zn_sin = np.sin(zeniths)
-        pairwise_zn_sin = zn_sin * zn_sin.T
-
-        zn_cos = np.cos(zeniths)
-        pairwise_zn_cos = zn_cos * zn_cos.T
-
-        pairwise_az_diff_cos = np.cos(azimuths - azimuths.T)
-
-        distances = np.arccos(
-            np.minimum(
-                1.0, pairwise_zn_sin + (pairwise_zn_cos * pairwise_az_diff_cos)
-            )
-        )
+        distances = np.repeat(zn_cos, partners)
+        distances *= zn_cos[vs]
+        scratch = azimuths[vs]
+        scratch -= np.repeat(azimuths, partners)
+        np.cos(scratch, out=scratch)
+        distances *= scratch
+        scratch = np.repeat(zn_sin, partners)
+        scratch *= zn_sin[vs]
+        np.add(scratch, distances, out=distances)
+        np.minimum(distances, 1.0, out=distances)
+        np.arccos(distances, out=distances)
 
         # vectorized calculation of brightness
-        brights = np.add(
-            np.power(pairwise_magnitudes, self._magnitude_power),
-            np.multiply(
-                np.power(distances, self._distance_power),
-                self._distance_coefficient,
-            ),
-        )
+        self._power(distances, self._distance_power)
+        distances *= self._distance_coefficient
+        brights = np.repeat(mags, partners)
+        brights += mags[vs]
+        self._power(brights, self._magnitude_power)
+        brights += distances
 
-        edges = np.array(
-            [
-                BrightEdge(
-                    index=(u, v),
-                    stars=(numbers[u], numbers[v]),
-                    brightness=brights[u, v],
-                    now_bright=brights[u, v],
-                )
-                if u < v
-                else None
-                for u in range(count)
-                for v in range(count)
-            ]
-        ).reshape(count, count)
-
-        return numbers, edges
+        return numbers, brights, us.astype(np.int32), vs.astype(np.int32)
 
     @staticmethod
-    def distance(
-        aa: np.float64, az: np.float64, ba: np.float64, bz: np.float64
-    ) -> np.float64:
+    def _power(values: np.ndarray, power: np.float32) -> None:
+        """raise values to power in place, squaring by multiplication"""
+        if power == 2.0:
+            np.multiply(values, values, out=values)
+        else:
+            np.power(values, power, out=values)
+
+    @staticmethod
+    def distance(aa: float, az: float, ba: float, bz: float) -> float:
         """calculate angular distance between two points on unit sphere
 
         with polar coords (azimuth, zenith) for two points on the sphere a, b:
@@ -245,7 +183,9 @@ class SkySegmenter:
 
         distance = arccos(sin(az)sin(bz) + cos(az)cos(bz)cos(ba - aa))
         """
-        return np.arccos(
-            (np.sin(az) * np.sin(bz))
-            + (np.cos(az) * np.cos(bz) * np.cos(ba - aa))
+        cos_distance: float = (sin(az) * sin(bz)) + (
+            cos(az) * cos(bz) * cos(ba - aa)
         )
+
+        # clamp rounding error, math.acos raises outside of [-1, 1]
+        return acos(max(-1.0, min(1.0, cos_distance)))
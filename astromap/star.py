@@ -1,16 +1,18 @@
 from dataclasses import dataclass
 from enum import StrEnum
 from operator import eq
-from typing import Final, TypeAlias
+from typing import Final, Sequence, TypeAlias
 import math
 
+import numpy as np
+
 
 class DeclinationSign(StrEnum):
     NEGATIVE = "-"
     POSITIVE = "+"
 
 
-@dataclass
+@dataclass(slots=True)
 class EquatorialCoordinates:
     # hours, minutes, seconds
     right_ascension: tuple[float, float, float]
@@ -19,7 +21,7 @@ class EquatorialCoordinates:
     declination: tuple[DeclinationSign, float, float, float]
 
 
-@dataclass
+@dataclass(slots=True)
 class PolarCoordinates:
     """
     equatorial coordinates expressed in radians
@@ -32,13 +34,13 @@ class PolarCoordinates:
     zenith: float
 
 
-@dataclass
+@dataclass(slots=True)
 class ProperMotion:
     right_ascension: float
     declination: float
 
 
-@dataclass
+@dataclass(slots=True)
 class BrightStar:
     """
     parameters of a star from the bright star catalog
@@ -98,6 +100,46 @@ def polar_from_proper(proper: ProperMotion) -> PolarCoordinates:
     return PolarCoordinates(azimuth=azimuth, zenith=zenith)
 
 
+def polar_arrays_from_equatorial(
+    ra_hours: np.ndarray,
+    ra_minutes: np.ndarray,
+    ra_seconds: np.ndarray,
+    negative: np.ndarray,
+    dec_degrees: np.ndarray,
+    dec_minutes: np.ndarray,
+    dec_seconds: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    convert arrays of equatorial coordinates to arrays of azimuth & zenith
+
+    - same arithmetic as polar_from_equatorial, one array at a time
+    - negative is true where the sign of declination is negative
+    """
+    azimuths: np.ndarray = np.radians(
+        ((ra_hours * 3600) + (ra_minutes * 60) + ra_seconds) * (15 / 3600)
+    )
+
+    zeniths: np.ndarray = np.radians(
+        dec_degrees + (dec_minutes / 60) + (dec_seconds / 3600)
+    )
+    zeniths = np.where(
+        negative, zeniths + (math.pi * 0.5), (math.pi * 0.5) - zeniths
+    )
+
+    return azimuths, zeniths
+
+
+def polar_arrays_from_proper(
+    pm_ra: np.ndarray, pm_dec: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    convert arrays of proper motion to arrays of azimuth & zenith
+
+    - same arithmetic as polar_from_proper, one array at a time
+    """
+    return np.radians(pm_ra / 3600), np.radians(pm_dec / -3600)
+
+
 # these catalog entries have been partially removed as they are not stars
 NOT_STARS: set[int] = set(
     [
@@ -124,17 +166,13 @@ def star_from_catalog(row: str) -> BrightStar | None:
     if len(row) < 170:
         return None
 
-    number: int = int(row[0:4], base=10)
+    try:
+        number: int = int(row[0:4], base=10)
 
-    if number in NOT_STARS:
-        return None
+        if number in NOT_STARS:
+            return None
 
-    try:
-        name: str | None = (
-            " ".join(row[4:14].strip().split())
-            if len(row[4:14].strip()) > 0
-            else None
-        )
+        name: str | None = name_from_catalog(row)
         equatorial: EquatorialCoordinates = EquatorialCoordinates(
             right_ascension=(
                 float(row[75:77]),
@@ -149,9 +187,7 @@ def star_from_catalog(row: str) -> BrightStar | None:
             ),
         )
         magnitude: float = float(row[102:107])
-        spectral: str | None = row[127:147].strip()
-        if len(spectral) < 1:
-            spectral = None
+        spectral: str | None = spectral_from_catalog(row)
         proper: ProperMotion = ProperMotion(
             float(row[148:154]),
             float(row[154:160]),
@@ -171,3 +207,191 @@ def star_from_catalog(row: str) -> BrightStar | None:
         proper=proper,
         spectral=spectral,
     )
+
+
+def name_from_catalog(row: str) -> str | None:
+    """parse star name from row of bright star catalog"""
+    name: str = row[4:14].strip()
+    return " ".join(name.split()) if len(name) > 0 else None
+
+
+def spectral_from_catalog(row: str) -> str | None:
+    """parse spectral type from row of bright star catalog"""
+    spectral: str = row[127:147].strip()
+    return spectral if len(spectral) > 0 else None
+
+
+# fixed width (start, stop) columns of numeric fields in bright star catalog
+CATALOG_COLUMNS: dict[str, tuple[int, int]] = {
+    "number": (0, 4),
+    "ra_hours": (75, 77),
+    "ra_minutes": (77, 79),
+    "ra_seconds": (79, 83),
+    "dec_degrees": (84, 86),
+    "dec_minutes": (86, 88),
+    "dec_seconds": (88, 90),
+    "magnitude": (102, 107),
+    "pm_ra": (148, 154),
+    "pm_dec": (154, 160),
+}
+
+
+def _catalog_floats(block: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """
+    parse one fixed width column of a block of catalog rows into floats
+
+    - fields that fail to parse are set to nan
+    """
+    fields: np.ndarray = (
+        np.ascontiguousarray(block[:, start:stop])
+        .view(f"S{stop - start}")
+        .ravel()
+    )
+    try:
+        return fields.astype(np.float64)
+    except ValueError:
+        # slow path, only taken when a column holds a malformed field
+        values: np.ndarray = np.empty(len(fields), dtype=np.float64)
+        for i, field in enumerate(fields.tolist()):
+            try:
+                values[i] = float(field)
+            except ValueError:
+                values[i] = math.nan
+        return values
+
+
+def stars_from_catalog(rows: Sequence[str | bytes]) -> list[BrightStar]:
+    """
+    parse star data from all rows of bright star catalog at once
+
+    - numeric columns are parsed a whole column at a time with numpy rather
+      than field by field, otherwise equivalent to star_from_catalog per row
+    - rows may be read from the catalog in text or binary mode
+    """
+    raw_rows: list[str | bytes] = [row for row in rows if len(row) >= 170]
+    if len(raw_rows) < 1:
+        return []
+
+    # fixed width rows as a 2d array of bytes, one row per catalog row
+    block: np.ndarray
+    try:
+        block = np.array(raw_rows, dtype=np.bytes_)
+    except UnicodeEncodeError:
+        # non ascii characters become one byte each, keeping columns aligned,
+        # & fail to parse if they fall in a numeric field
+        block = np.array(
+            [
+                (
+                    row.encode("ascii", errors="replace")
+                    if isinstance(row, str)
+                    else row
+                )
+                for row in raw_rows
+            ],
+            dtype=np.bytes_,
+        )
+    block = block.view(np.uint8).reshape(len(raw_rows), -1)
+
+    # names, spectral types & messages are parsed from rows as text
+    texts: list[str] = [
+        row.decode("ascii", errors="replace") if isinstance(row, bytes) else row
+        for row in raw_rows
+    ]
+
+    numbers: np.ndarray = _catalog_floats(block, *CATALOG_COLUMNS["number"])
+    stars_mask: np.ndarray = ~np.isin(numbers, list(NOT_STARS))
+    block = block[stars_mask]
+    texts = [row for row, is_star in zip(texts, stars_mask.tolist()) if is_star]
+
+    # catalog numbers are already parsed, only the other columns remain
+    columns: dict[str, np.ndarray] = {
+        name: (
+            numbers[stars_mask]
+            if name == "number"
+            else _catalog_floats(block, start, stop)
+        )
+        for name, (start, stop) in CATALOG_COLUMNS.items()
+    }
+    negative: np.ndarray = block[:, 83] == ord(DeclinationSign.NEGATIVE)
+    positive: np.ndarray = block[:, 83] == ord(DeclinationSign.POSITIVE)
+
+    valid: np.ndarray = negative | positive
+    for values in columns.values():
+        valid &= ~np.isnan(values)
+
+    # rows that failed are parsed again one at a time, reporting the error
+    for row in [row for row, ok in zip(texts, valid.tolist()) if not ok]:
+        star_from_catalog(row)
+
+    texts = [row for row, ok in zip(texts, valid.tolist()) if ok]
+    negative = negative[valid]
+    columns = {name: values[valid] for name, values in columns.items()}
+
+    # polar coordinates of all stars are converted a whole array at a time
+    azimuths, zeniths = polar_arrays_from_equatorial(
+        columns["ra_hours"],
+        columns["ra_minutes"],
+        columns["ra_seconds"],
+        negative,
+        columns["dec_degrees"],
+        columns["dec_minutes"],
+        columns["dec_seconds"],
+    )
+    motion_azimuths, motion_zeniths = polar_arrays_from_proper(
+        columns["pm_ra"], columns["pm_dec"]
+    )
+
+    signs: list[DeclinationSign] = [
+        DeclinationSign.NEGATIVE if is_negative else DeclinationSign.POSITIVE
+        for is_negative in negative.tolist()
+    ]
+    fields: list[list[float]] = [
+        values.tolist()
+        for values in (
+            *columns.values(),
+            azimuths,
+            zeniths,
+            motion_azimuths,
+            motion_zeniths,
+        )
+    ]
+
+    # unpacked in CATALOG_COLUMNS order, followed by the polar coordinates
+    stars: list[BrightStar] = []
+    for (
+        row,
+        sign,
+        number,
+        ra_hours,
+        ra_minutes,
+        ra_seconds,
+        dec_degrees,
+        dec_minutes,
+        dec_seconds,
+        magnitude,
+        pm_ra,
+        pm_dec,
+        azimuth,
+        zenith,
+        motion_azimuth,
+        motion_zenith,
+    ) in zip(texts, signs, *fields):
+        stars.append(
+            BrightStar(
+                number=int(number),
+                name=name_from_catalog(row),
+                magnitude=magnitude,
+                coords=PolarCoordinates(azimuth=azimuth, zenith=zenith),
+                motion=PolarCoordinates(
+                    azimuth=motion_azimuth, zenith=motion_zenith
+                ),
+                equatorial=EquatorialCoordinates(
+                    right_ascension=(ra_hours, ra_minutes, ra_seconds),
+                    declination=(sign, dec_degrees, dec_minutes, dec_seconds),
+                ),
+                proper=ProperMotion(pm_ra, pm_dec),
+                spectral=spectral_from_catalog(row),
+            )
+        )
+
+    return stars
@@ -1,23 +1,92 @@
+import io
 import math
+from pathlib import Path
+from typing import Final, Self, Sequence
 
 import cairo
+import numpy as np
 
 from astromap.star import BrightStar
 
+# width of the map in radians of azimuth
+TWO_PI: Final[float] = math.tau
+
+# rings of less area than this, in square pixels, cover under half a level of
+# any 8-bit pixel, so can never change the image
+FAINTEST_AREA_PX: Final[float] = 0.5 / 255
+
 
 class StarMap:
+    """
+    map of bright stars, rendered as an image
+    """
+
     def __init__(
-        self, stars: list[BrightStar], size: int = 9, pad: int = 16
+        self, stars: Sequence[BrightStar], size: int = 9, pad: int = 16
     ) -> None:
-        self._stars: list[BrightStar] = list(stars)
+        azimuths: np.ndarray = np.fromiter(
+            (star.coords.azimuth for star in stars),
+            dtype=np.float64,
+            count=len(stars),
+        )
+        zeniths: np.ndarray = np.fromiter(
+            (star.coords.zenith for star in stars),
+            dtype=np.float64,
+            count=len(stars),
+        )
+        magnitudes: np.ndarray = np.fromiter(
+            (star.magnitude for star in stars),
+            dtype=np.float64,
+            count=len(stars),
+        )
+        self._setup(azimuths, zeniths, magnitudes, size, pad)
+
+    @classmethod
+    def from_arrays(
+        cls,
+        azimuths: np.ndarray,
+        zeniths: np.ndarray,
+        magnitudes: np.ndarray,
+        size: int = 9,
+        pad: int = 16,
+    ) -> Self:
+        """
+        map of stars given as arrays of their azimuths, zeniths & magnitudes,
+        as returned by BrightStarCatalog.bright_arrays
+        """
+        starmap: Self = cls.__new__(cls)
+        starmap._setup(
+            np.asarray(azimuths, dtype=np.float64),
+            np.asarray(zeniths, dtype=np.float64),
+            np.asarray(magnitudes, dtype=np.float64),
+            size,
+            pad,
+        )
+        return starmap
 
+    def _setup(
+        self,
+        azimuths: np.ndarray,
+        zeniths: np.ndarray,
+        magnitudes: np.ndarray,
+        size: int,
+        pad: int,
+    ) -> None:
         # size of rendered image in pixels
-        self._map_px_size: int = 2**size
-        self._map_px_pad: int = math.floor(self._map_px_size / pad)
-        self._px_width: int = (self._map_px_size * 2) + (self._map_px_pad * 2)
-        self._px_height: int = self._map_px_size + (self._map_px_pad * 2)
+        self._size: int = size
+        self._pad: int = pad
+        self._map_px_size: int
+        self._map_px_pad: int
+        self._px_width: int
+        self._px_height: int
+        (
+            self._map_px_size,
+            self._map_px_pad,
+            self._px_width,
+            self._px_height,
+        ) = self._image_size(size, pad)
 
-        # amount to scale rendering in cairo to fill image
+        # pixels per radian of map coordinates
         self._map_scale: float = self._map_px_size / math.pi
 
         # set size of stars
@@ -38,48 +107,400 @@ class StarMap:
         )
         self._star_stroke: float = 0.008
 
-    def render_map(self, context: cairo.Context) -> None:
-        # set padded & scaled origin
-        context.translate(self._map_px_pad, self._map_px_pad)
-        context.scale(self._map_scale, self._map_scale)
-
-        # draw field
-        context.set_source_rgba(*self._field_color)
-        context.rectangle(0, 0, math.pi * 2, math.pi)
-        context.fill()
-
-        context.set_source_rgba(*self._star_color)
-        context.set_line_width(self._star_stroke)
-
-        for star in self._stars:
-            # push context & translate to center of star
-            context.save()
-            context.translate(
-                (math.pi * 2) - star.coords.azimuth, star.coords.zenith
+        # stroke & field rectangle in image pixels, padding included
+        self._line_width_px: float = self._star_stroke * self._map_scale
+        self._field_px: tuple[slice, slice] = (
+            slice(self._map_px_pad, self._map_px_pad + self._map_px_size),
+            slice(self._map_px_pad, self._map_px_pad + (self._map_px_size * 2)),
+        )
+
+        # star geometry is fixed, so centers & radii are computed once, in
+        # image pixels with padding included
+        scale: float = self._map_scale
+        pad_px: int = self._map_px_pad
+        self._cx_px: np.ndarray = ((TWO_PI - azimuths) * scale) + pad_px
+        self._cy_px: np.ndarray = (zeniths * scale) + pad_px
+        # (star_base - magnitude) ** 1.3 as exp(1.3 * log(...)), in place
+        self._r_px: np.ndarray = np.maximum(1.0, self._star_base - magnitudes)
+        np.log(self._r_px, out=self._r_px)
+        self._r_px *= 1.3
+        np.exp(self._r_px, out=self._r_px)
+        self._r_px *= self._star_k * scale
+
+        # stars whose stroked ring can't change a pixel, or centered off the
+        # image, are never drawn
+        visible: np.ndarray = (
+            (self._ring_areas(self._r_px) >= FAINTEST_AREA_PX)
+            & (self._cx_px >= 0)
+            & (self._cx_px < self._px_width)
+            & (self._cy_px >= 0)
+            & (self._cy_px < self._px_height)
+        )
+        self._cx_px = self._cx_px[visible]
+        self._cy_px = self._cy_px[visible]
+        self._r_px = self._r_px[visible]
+        count: int = len(self._r_px)
+
+        # colors are quantized to ARGB32 pixels once, rather than per render
+        self._field_bgra: np.ndarray = self._premultiplied_bgra(
+            self._field_color
+        )
+        self._field_pixel: np.uint32 = self._field_bgra.view(np.uint32)[0]
+        self._star_bgra: np.ndarray = self._premultiplied_bgra(self._star_color)
+
+        # rings are supersampled on a grid of samples x samples points per
+        # pixel, at each star's exact center & radius, with at least two
+        # samples across the stroke where a byte can count them all
+        self._coverage_samples: int = min(
+            15, max(4, math.ceil(2 / self._line_width_px))
+        )
+
+        # pixels touched by any star, with what compositing every star leaves
+        # there: pixel * trans + src
+        self._star_rows: np.ndarray = np.empty(0, dtype=np.intp)
+        self._star_cols: np.ndarray = np.empty(0, dtype=np.intp)
+        self._star_trans: np.ndarray = np.empty((0, 1), dtype=np.float64)
+        self._star_src: np.ndarray = np.empty((0, 4), dtype=np.float64)
+        if count > 0 and self._star_color[3] > 0:
+            self._make_coverage()
+
+        # map is rendered once, then reused by every output
+        self._pixels: np.ndarray | None = None
+        self._recording: cairo.ImageSurface | None = None
+
+    @staticmethod
+    def _image_size(size: int, pad: int) -> tuple[int, int, int, int]:
+        """map size, padding, image width & image height, all in pixels"""
+        map_px_size: int = 2**size
+        map_px_pad: int = math.floor(map_px_size / pad)
+        return (
+            map_px_size,
+            map_px_pad,
+            (map_px_size * 2) + (map_px_pad * 2),
+            map_px_size + (map_px_pad * 2),
+        )
+
+    @staticmethod
+    def _premultiplied_bgra(
+        color: tuple[float, float, float, float],
+    ) -> np.ndarray:
+        """
+        rgba color as a premultiplied pixel, in ARGB32's little endian byte
+        order
+        """
+        red, green, blue, alpha = color
+        return np.array(
+            [
+                int((blue * alpha * 255) + 0.5),
+                int((green * alpha * 255) + 0.5),
+                int((red * alpha * 255) + 0.5),
+                int((alpha * 255) + 0.5),
+            ],
+            dtype=np.uint8,
+        )
+
+    @classmethod
+    def make_buffer(
+        cls, size: int = 9, pad: int = 16
+    ) -> tuple[np.ndarray, cairo.ImageSurface]:
+        """
+        zeroed ARGB32 pixel array for a map of size & pad, with an image
+        surface sharing its memory
+
+        - array is (height, stride / 4, 4), rows may be padded past the
+          image's width
+        - buffers can be passed to render_png to reuse them across maps of
+          the same size
+        """
+        _, _, width, height = cls._image_size(size, pad)
+        stride: int = cairo.ImageSurface.format_stride_for_width(
+            cairo.FORMAT_ARGB32, width
+        )
+        pixels: np.ndarray = np.zeros((height, stride // 4, 4), dtype=np.uint8)
+        surface = cairo.ImageSurface.create_for_data(
+            memoryview(pixels).cast("B"),
+            cairo.FORMAT_ARGB32,
+            width,
+            height,
+            stride,
+        )
+        return pixels, surface
+
+    def _ring_areas(self, r: np.ndarray) -> np.ndarray:
+        """area of stroked rings of radii r, in square pixels"""
+        stroke: float = self._line_width_px / 2
+        return math.pi * (
+            np.square(r + stroke) - np.square(np.maximum(r - stroke, 0.0))
+        )
+
+    def _ring_coverage(
+        self,
+        cx: np.ndarray,
+        cy: np.ndarray,
+        r: np.ndarray,
+        half: int,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        image rows, columns & coverage of pixels under the rings of stars
+        whose rings fit within half pixels of the pixel holding their center
+        """
+        samples: int = self._coverage_samples
+        size: int = (half * 2) + 1
+        left: np.ndarray = np.floor(cx).astype(np.intp) - half
+        top: np.ndarray = np.floor(cy).astype(np.intp) - half
+
+        # sample points of the window, relative to each star's center
+        grid: np.ndarray = (
+            np.arange(size)[:, np.newaxis]
+            + ((np.arange(samples) + 0.5) / samples)
+        ).ravel()
+        xs: np.ndarray = ((left - cx)[:, np.newaxis] + grid).astype(np.float32)
+        ys: np.ndarray = ((top - cy)[:, np.newaxis] + grid).astype(np.float32)
+
+        # a sample is inked when its squared distance from the center lies
+        # between the squared inner & outer edges of the stroke
+        stroke: float = self._line_width_px / 2
+        inner: np.ndarray = np.square(np.maximum(r - stroke, 0.0))
+        outer: np.ndarray = np.square(r + stroke)
+        middle: np.ndarray = ((inner + outer) / 2).astype(np.float32)
+        spread: np.ndarray = ((outer - inner) / 2).astype(np.float32)
+        squares: np.ndarray = (np.square(ys) - middle[:, np.newaxis])[
+            :, :, np.newaxis
+        ] + np.square(xs)[:, np.newaxis, :]
+        np.abs(squares, out=squares)
+        ink: np.ndarray = squares <= spread[:, np.newaxis, np.newaxis]
+
+        # count inked samples per pixel, adding whole planes of sample rows
+        # then sample columns, much faster than reducing the short axes
+        planes: np.ndarray = ink.view(np.uint8).reshape(
+            len(cx), size, samples, size, samples
+        )
+        sample_rows: np.ndarray = planes[:, :, 0].copy()
+        for i in range(1, samples):
+            sample_rows += planes[:, :, i]
+        counts: np.ndarray = sample_rows[..., 0].copy()
+        for i in range(1, samples):
+            counts += sample_rows[..., i]
+
+        star, dy, dx = np.nonzero(counts)
+        return (
+            top[star] + dy,
+            left[star] + dx,
+            counts[star, dy, dx] / (samples * samples),
+        )
+
+    def _splat_coverage(
+        self, cx: np.ndarray, cy: np.ndarray, r: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        image rows, columns & coverage of pixels under rings too thin for the
+        sample grid, as each ring's area spread along its center line
+
+        - points are spaced a sample apart, each carrying an equal share of
+          the ring's area to the pixel it lands in
+        - a star's shares in the same pixel are summed, clamped to 1
+        """
+        samples: int = self._coverage_samples
+        areas: np.ndarray = self._ring_areas(r)
+
+        # points around each ring, indexed by star, with their angles
+        counts: np.ndarray = np.maximum(
+            1, np.ceil(TWO_PI * r * samples).astype(np.intp)
+        )
+        star: np.ndarray = np.repeat(np.arange(len(r)), counts)
+        firsts: np.ndarray = np.cumsum(counts) - counts
+        angles: np.ndarray = (
+            (np.arange(len(star)) - firsts[star] + 0.5) * TWO_PI / counts[star]
+        )
+        row: np.ndarray = np.floor(cy[star] + (r[star] * np.sin(angles)))
+        col: np.ndarray = np.floor(cx[star] + (r[star] * np.cos(angles)))
+
+        # sum each star's shares per pixel, keyed by star then pixel
+        width: int = self._px_width + 2
+        height: int = self._px_height + 2
+        keys: np.ndarray = (star * (width * height)) + (
+            ((row.astype(np.intp) + 1) * width) + col.astype(np.intp) + 1
+        )
+        pixels, inverse = np.unique(keys, return_inverse=True)
+        coverage: np.ndarray = np.minimum(
+            np.bincount(inverse, weights=(areas / counts)[star]), 1.0
+        )
+        rows, cols = np.divmod(pixels % (width * height), width)
+        return rows - 1, cols - 1, coverage
+
+    def _make_coverage(self) -> None:
+        # every star is the same color, so compositing them in any order
+        # leaves each pixel at color / alpha * (1 - trans) + pixel * trans,
+        # where trans is the product of (1 - coverage * alpha) over the stars
+        # touching it, with color premultiplied by alpha
+        stroke: float = self._line_width_px / 2
+        halves: np.ndarray = np.ceil(self._r_px + stroke).astype(np.intp) + 1
+
+        # rings narrower than the diagonal between samples can slip through
+        # the sample grid, so are splatted instead, as a window size of 0
+        widths: np.ndarray = np.minimum(
+            self._line_width_px, self._r_px + stroke
+        )
+        halves[widths < (math.sqrt(2) / self._coverage_samples)] = 0
+
+        # order stars by window size, then top to bottom, so stars sharing a
+        # window size are contiguous & sampled in scanline order
+        by_window: np.ndarray = np.lexsort((self._cy_px, halves))
+        self._cx_px = self._cx_px[by_window]
+        self._cy_px = self._cy_px[by_window]
+        self._r_px = self._r_px[by_window]
+        halves = halves[by_window]
+
+        rows: list[np.ndarray] = []
+        cols: list[np.ndarray] = []
+        coverages: list[np.ndarray] = []
+        groups: list[int] = np.flatnonzero(
+            np.concatenate(([True], halves[1:] != halves[:-1]))
+        ).tolist()
+        for start, stop in zip(groups, [*groups[1:], len(halves)]):
+            half: int = int(halves[start])
+            if half == 0:
+                splat: tuple[np.ndarray, np.ndarray, np.ndarray] = (
+                    self._splat_coverage(
+                        self._cx_px[start:stop],
+                        self._cy_px[start:stop],
+                        self._r_px[start:stop],
+                    )
+                )
+                rows.append(splat[0])
+                cols.append(splat[1])
+                coverages.append(splat[2])
+                continue
+
+            # sample a bounded number of points at a time
+            window: int = ((half * 2) + 1) * self._coverage_samples
+            step: int = max(1, (1 << 22) // (window * window))
+            for first in range(start, stop, step):
+                last: int = min(first + step, stop)
+                ring: tuple[np.ndarray, np.ndarray, np.ndarray] = (
+                    self._ring_coverage(
+                        self._cx_px[first:last],
+                        self._cy_px[first:last],
+                        self._r_px[first:last],
+                        half,
+                    )
+                )
+                rows.append(ring[0])
+                cols.append(ring[1])
+                coverages.append(ring[2])
+
+        row: np.ndarray = np.concatenate(rows)
+        col: np.ndarray = np.concatenate(cols)
+        coverage: np.ndarray = np.concatenate(coverages)
+
+        # clip rings to the image
+        inside: np.ndarray = (
+            (row >= 0)
+            & (row < self._px_height)
+            & (col >= 0)
+            & (col < self._px_width)
+        )
+        flat: np.ndarray = (row[inside] * self._px_width) + col[inside]
+        if flat.size == 0:
+            return
+
+        # sort so every pixel's factors are contiguous, then reduce each run
+        order: np.ndarray = np.argsort(flat)
+        flat = flat[order]
+        starts: np.ndarray = np.flatnonzero(
+            np.concatenate(([True], flat[1:] != flat[:-1]))
+        )
+        alpha: float = self._star_color[3]
+        trans: np.ndarray = np.multiply.reduceat(
+            1.0 - (coverage[inside][order] * alpha), starts
+        )
+
+        self._star_rows, self._star_cols = np.divmod(
+            flat[starts], self._px_width
+        )
+        self._star_trans = trans[:, np.newaxis]
+        self._star_src = self._star_bgra * ((1.0 - self._star_trans) / alpha)
+
+    def _draw_field(self, pixels: np.ndarray) -> None:
+        """composite the field over the map's ARGB32 pixel array"""
+        field: np.ndarray = pixels[self._field_px]
+        alpha: float = self._field_color[3]
+        if alpha >= 1.0:
+            # fill whole pixels at once, as 32 bit words
+            field.view(np.uint32).fill(self._field_pixel)
+        else:
+            field[...] = np.rint(self._field_bgra + (field * (1.0 - alpha)))
+
+    def _draw_stars(self, pixels: np.ndarray) -> None:
+        """composite stars over the map's ARGB32 pixel array, shape (h, w, 4)"""
+        rows: np.ndarray = self._star_rows
+        cols: np.ndarray = self._star_cols
+        pixels[rows, cols] = np.rint(
+            self._star_src + (pixels[rows, cols] * self._star_trans)
+        )
+
+    def _render_into(
+        self, buffer: tuple[np.ndarray, cairo.ImageSurface]
+    ) -> cairo.ImageSurface:
+        """clear a buffer from make_buffer & draw the map into it"""
+        pixels, surface = buffer
+        if (
+            surface.get_width() != self._px_width
+            or surface.get_height() != self._px_height
+        ):
+            raise ValueError(
+                f"buffer is {surface.get_width()}x{surface.get_height()}, "
+                f"map is {self._px_width}x{self._px_height}"
             )
 
-            self.render_star(context, star.magnitude)
+        surface.flush()
+
+        # padding around the map is left transparent
+        pixels.fill(0)
+        image: np.ndarray = pixels[:, : self._px_width]
+        self._draw_field(image)
+        self._draw_stars(image)
 
-            # pop context
-            context.restore()
+        surface.mark_dirty()
+        return surface
 
-    def render_star(self, context: cairo.Context, magnitude: float):
-        radius: float = (
-            max(1, (self._star_base - magnitude) ** 1.3)
-        ) * self._star_k
+    def record(self) -> cairo.ImageSurface:
+        """render map once, returning the cached image surface"""
+        if self._recording is None:
+            # surface borrows the array's memory, so keep both
+            buffer = self.make_buffer(self._size, self._pad)
+            self._pixels = buffer[0]
+            self._recording = self._render_into(buffer)
 
-        # Draw the circle
-        context.arc(0, 0, radius, 0, 2 * math.pi)
-        context.stroke()
+        return self._recording
 
-    def render_png(self, path: str) -> None:
-        surface = cairo.ImageSurface(
-            cairo.FORMAT_ARGB32, self._px_width, self._px_height
+    def render_map(self, context: cairo.Context) -> None:
+        context.set_source_surface(self.record(), 0, 0)
+        context.paint()
+
+    def render_png_bytes(
+        self, buffer: tuple[np.ndarray, cairo.ImageSurface] | None = None
+    ) -> bytes:
+        """
+        map encoded as png, in memory
+
+        - given a buffer from make_buffer, the map is drawn into it rather
+          than the map's own cached image
+        """
+        surface: cairo.ImageSurface = (
+            self.record() if buffer is None else self._render_into(buffer)
         )
-        context = cairo.Context(surface)
+        png = io.BytesIO()
+        surface.write_to_png(png)
+        return png.getvalue()
 
-        self.render_map(context)
+    def render_png(
+        self,
+        path: str,
+        buffer: tuple[np.ndarray, cairo.ImageSurface] | None = None,
+    ) -> None:
+        png: bytes = self.render_png_bytes(buffer)
 
         print(f"writing image to '{path}'")
 
-        surface.write_to_png(path)
+        Path(path).write_bytes(png)
@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+
+from astromap.catalog import BrightStarCatalog
+
+
+@pytest.fixture(scope="module")
+def catalog_path() -> Path:
+    return Path(__file__).parent / ".." / "vendor" / "ybsc5" / "catalog"
+
+
+@pytest.fixture(scope="module")
+def catalog(catalog_path: Path) -> BrightStarCatalog:
+    with open(catalog_path) as table:
+        return BrightStarCatalog(table)
@@ -1,3 +1,4 @@
+import mmap
 from pathlib import Path
 
 from astromap.catalog import BrightStarCatalog
@@ -6,8 +7,11 @@ import numpy as np
 
 
 vendor_dir_path = Path(__file__).parent / ".." / "vendor" / "ybsc5" / "catalog"
-table = open(vendor_dir_path)
-catalog = BrightStarCatalog(table)
+with (
+    open(vendor_dir_path, "rb") as table,
+    mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ) as data,
+):
+    catalog = BrightStarCatalog(data)
 
 segmenter = SkySegmenter(catalog)
 segmenter.segment()
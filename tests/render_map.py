@@ -1,3 +1,4 @@
+import mmap
 from pathlib import Path
 
 from astromap.catalog import BrightStarCatalog
@@ -5,8 +6,11 @@ from astromap.starmap import StarMap
 
 
 vendor_dir_path = Path(__file__).parent / ".." / "vendor" / "ybsc5" / "catalog"
-table = open(vendor_dir_path)
-catalog = BrightStarCatalog(table)
+with (
+    open(vendor_dir_path, "rb") as table,
+    mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ) as data,
+):
+    catalog = BrightStarCatalog(data)
 
 image_build_path = Path(__file__).parent / ".." / "build"
 
@@ -17,8 +21,8 @@ except FileExistsError:
 
 image_path = str((image_build_path / "map.png").resolve())
 
-stars = [catalog.bright(i) for i in range(500)]
+stars = catalog.bright_arrays(0, 500)
 
-starmap = StarMap(stars, size=10)
+starmap = StarMap.from_arrays(*stars, size=10)
 starmap.render_png(image_path)
 
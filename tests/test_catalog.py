@@ -0,0 +1,59 @@
+import mmap
+from pathlib import Path
+
+import numpy as np
+
+from astromap.catalog import BrightStarCatalog
+
+
+def test_bulk_arrays_match_stars(catalog: BrightStarCatalog) -> None:
+    numbers, magnitudes, azimuths, zeniths = catalog.bulk_arrays(3.0)
+
+    expected = [star for star in catalog if star.magnitude <= 3.0]
+    assert len(numbers) == len(expected)
+    assert np.all(np.diff(magnitudes) >= 0)
+
+    for number, magnitude, azimuth, zenith in zip(
+        numbers.tolist(),
+        magnitudes.tolist(),
+        azimuths.tolist(),
+        zeniths.tolist(),
+    ):
+        star = catalog[number]
+        assert star.magnitude == magnitude
+        assert star.coords.azimuth == azimuth
+        assert star.coords.zenith == zenith
+
+
+def test_binary_table_matches_text(
+    catalog: BrightStarCatalog, catalog_path: Path
+) -> None:
+    with open(catalog_path, "rb") as table:
+        binary_catalog = BrightStarCatalog(table)
+
+    assert list(binary_catalog) == list(catalog)
+
+
+def test_mapped_table_matches_text(
+    catalog: BrightStarCatalog, catalog_path: Path
+) -> None:
+    with (
+        open(catalog_path, "rb") as table,
+        mmap.mmap(table.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        mapped_catalog = BrightStarCatalog(data)
+
+    assert list(mapped_catalog) == list(catalog)
+
+
+def test_bright_arrays_match_bright(catalog: BrightStarCatalog) -> None:
+    azimuths, zeniths, magnitudes = catalog.bright_arrays(0, 50)
+
+    assert len(magnitudes) == 50
+    for n, (azimuth, zenith, magnitude) in enumerate(
+        zip(azimuths.tolist(), zeniths.tolist(), magnitudes.tolist())
+    ):
+        star = catalog.bright(n)
+        assert star.coords.azimuth == azimuth
+        assert star.coords.zenith == zenith
+        assert star.magnitude == magnitude
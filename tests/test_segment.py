@@ -0,0 +1,140 @@
+import math
+
+from astromap.catalog import BrightStarCatalog
+from astromap.segment import SkySegmenter
+
+
+def test_segment_groups_every_star(catalog: BrightStarCatalog) -> None:
+    segmenter = SkySegmenter(catalog)
+    segmenter.segment(max_magnitude=2.5)
+
+    count = len(segmenter._numbers)
+    assert count > 1
+    assert sorted(segmenter._members) == list(range(count))
+
+    for group_index, group in enumerate(segmenter._groups):
+        for u, v in group:
+            assert u < v
+            assert segmenter._members[u] == group_index
+            assert segmenter._members[v] == group_index
+
+
+# segmentation at magnitude 1.5, as catalog numbers, pinned to the original
+# argmin implementation
+EXPECTED_GROUPS = [
+    [
+        (1713, 1457),
+        (1713, 2061),
+        (1713, 2943),
+        (1713, 3982),
+        (1713, 5056),
+        (1713, 6134),
+        (1713, 7557),
+        (2061, 1457),
+        (2061, 5056),
+        (2061, 6134),
+        (2061, 7557),
+        (2326, 1713),
+        (2326, 2618),
+        (2326, 5340),
+        (2326, 7001),
+        (2326, 7557),
+        (2326, 7924),
+        (2491, 472),
+        (2491, 1457),
+        (2491, 1713),
+        (2491, 2061),
+        (2491, 2326),
+        (2491, 2618),
+        (2491, 2943),
+        (2491, 2990),
+        (2491, 3982),
+        (2491, 5056),
+        (2491, 5340),
+        (2491, 6134),
+        (2491, 7001),
+        (2491, 7557),
+        (2491, 7924),
+        (2491, 8728),
+        (2943, 1457),
+        (2943, 2061),
+        (2943, 3982),
+        (2943, 5056),
+        (2943, 6134),
+        (2943, 7557),
+        (5340, 472),
+        (5340, 1457),
+        (5340, 1713),
+        (5340, 2061),
+        (5340, 2943),
+        (5340, 3982),
+        (5340, 5056),
+        (5340, 7001),
+        (5340, 7557),
+        (5340, 8728),
+        (7001, 1713),
+        (7001, 2061),
+        (7001, 2618),
+        (7001, 2943),
+        (7001, 7557),
+        (7001, 7924),
+    ],
+    [
+        (1708, 5267),
+        (5459, 1708),
+        (5459, 4730),
+        (5459, 4853),
+        (5459, 5267),
+        (5459, 5460),
+    ],
+]
+EXPECTED_MEMBERS = {
+    472: 0,
+    1457: 0,
+    1708: 1,
+    1713: 0,
+    2061: 0,
+    2326: 0,
+    2491: 0,
+    2618: 0,
+    2943: 0,
+    2990: 0,
+    3982: 0,
+    4730: 1,
+    4853: 1,
+    5056: 0,
+    5267: 1,
+    5340: 0,
+    5459: 1,
+    5460: 1,
+    6134: 0,
+    7001: 0,
+    7557: 0,
+    7924: 0,
+    8728: 0,
+}
+
+
+def test_segment_matches_pinned_groups(catalog: BrightStarCatalog) -> None:
+    segmenter = SkySegmenter(catalog)
+    segmenter.segment(max_magnitude=1.5)
+
+    numbers: list[int] = segmenter._numbers.tolist()
+    groups = [
+        sorted((numbers[u], numbers[v]) for u, v in group)
+        for group in segmenter._groups
+    ]
+    members = {
+        numbers[star]: group for star, group in segmenter._members.items()
+    }
+
+    assert groups == EXPECTED_GROUPS
+    assert members == EXPECTED_MEMBERS
+
+
+def test_distance_clamps_rounding_error() -> None:
+    # cosine of the distance rounds to just outside [-1, 1] at this zenith
+    zenith = 1.8635416495909773
+
+    assert SkySegmenter.distance(0.0, zenith, 0.0, zenith) == 0.0
+    assert SkySegmenter.distance(0.0, zenith, math.pi, -zenith) == math.pi
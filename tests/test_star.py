@@ -0,0 +1,37 @@
+from pathlib import Path
+
+import pytest
+
+from astromap.star import star_from_catalog, stars_from_catalog
+
+
+def replace(row: str, start: int, text: str) -> str:
+    """overwrite part of a fixed width catalog row"""
+    stop: int = start + len(text)
+    return row[:start] + text + row[stop:]
+
+
+def test_bulk_parse_matches_row_parse(
+    catalog_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with open(catalog_path) as table:
+        rows = list(table)
+
+    row = rows[100]
+    malformed = [
+        replace(row, 102, " x.xx"),  # bad float
+        replace(row, 83, "*"),  # bad declination sign
+        replace(row, 0, "abcd"),  # non numeric catalog number
+        replace(row, 148, "+0.0é1"),  # non ascii in a numeric field
+    ]
+    named = replace(row, 4, "Álnitak   ")  # non ascii name still parses
+    rows += [*malformed, named]
+
+    expected = [star for row in rows if (star := star_from_catalog(row))]
+    expected_output = capsys.readouterr().out
+    stars = stars_from_catalog(rows)
+
+    assert stars == expected
+    assert stars[-1].name == "Álnitak"
+    assert capsys.readouterr().out == expected_output
+    assert expected_output.count("failed to parse row") == len(malformed)
@@ -0,0 +1,138 @@
+import numpy as np
+import pytest
+
+from astromap.catalog import BrightStarCatalog
+
+cairo = pytest.importorskip("cairo")
+
+from astromap.starmap import StarMap  # noqa: E402
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def test_list_and_arrays_render_same_pixels(
+    catalog: BrightStarCatalog,
+) -> None:
+    listed = StarMap([catalog.bright(n) for n in range(300)], size=8)
+    arrayed = StarMap.from_arrays(*catalog.bright_arrays(0, 300), size=8)
+    listed_buffer = StarMap.make_buffer(size=8)
+    arrayed_buffer = StarMap.make_buffer(size=8)
+    listed.render_png_bytes(listed_buffer)
+    arrayed.render_png_bytes(arrayed_buffer)
+
+    assert listed_buffer[0].any()
+    assert np.array_equal(listed_buffer[0], arrayed_buffer[0])
+
+
+def test_shared_buffer_matches_record(catalog: BrightStarCatalog) -> None:
+    buffer = StarMap.make_buffer(size=8)
+    for start in (0, 100):
+        star_map = StarMap.from_arrays(
+            *catalog.bright_arrays(start, start + 100), size=8
+        )
+        shared = star_map.render_png_bytes(buffer)
+
+        assert shared == star_map.render_png_bytes()
+        assert shared.startswith(PNG_SIGNATURE)
+
+
+def test_wrong_size_buffer_raises(catalog: BrightStarCatalog) -> None:
+    star_map = StarMap.from_arrays(*catalog.bright_arrays(0, 10), size=8)
+
+    with pytest.raises(ValueError):
+        star_map.render_png_bytes(StarMap.make_buffer(size=9))
+
+
+def reference_ring(
+    star_map: StarMap, row: int, col: int, samples: int = 64
+) -> float:
+    """fraction of a pixel under a star's stroked ring, finely sampled"""
+    offsets = (np.arange(samples) + 0.5) / samples
+    ys = (row + offsets - star_map._cy_px[0])[:, np.newaxis]
+    xs = (col + offsets - star_map._cx_px[0])[np.newaxis, :]
+    distances = np.hypot(ys, xs)
+    stroke = star_map._line_width_px / 2
+    ink = np.abs(distances - star_map._r_px[0]) <= stroke
+    return float(ink.mean())
+
+
+# largest difference in a pixel's coverage from the finely sampled ring
+COVERAGE_TOLERANCE = 0.15
+
+
+@pytest.mark.parametrize("size", [4, 6, 10])
+@pytest.mark.parametrize("rank", [0, 40, 400, 4000])
+def test_star_coverage_matches_reference_ring(
+    catalog: BrightStarCatalog, rank: int, size: int
+) -> None:
+    star_map = StarMap([catalog.bright(rank)], size=size)
+    assert len(star_map._r_px) == 1
+
+    coverage = {
+        (int(row), int(col)): 1.0 - float(trans)
+        for row, col, trans in zip(
+            star_map._star_rows, star_map._star_cols, star_map._star_trans[:, 0]
+        )
+    }
+    extent = star_map._r_px[0] + star_map._line_width_px
+    rows = range(
+        int(star_map._cy_px[0] - extent) - 1,
+        int(star_map._cy_px[0] + extent) + 2,
+    )
+    cols = range(
+        int(star_map._cx_px[0] - extent) - 1,
+        int(star_map._cx_px[0] + extent) + 2,
+    )
+    for row in rows:
+        for col in cols:
+            if not (
+                0 <= row < star_map._px_height and 0 <= col < star_map._px_width
+            ):
+                continue
+
+            expected = reference_ring(star_map, row, col)
+            actual = coverage.get((row, col), 0.0)
+            assert abs(actual - expected) <= COVERAGE_TOLERANCE, (row, col)
+
+
+@pytest.mark.parametrize("size", [1, 2, 4])
+@pytest.mark.parametrize("count", [1, 5])
+def test_small_maps_draw_every_kept_star(
+    catalog: BrightStarCatalog, size: int, count: int
+) -> None:
+    star_map = StarMap.from_arrays(*catalog.bright_arrays(0, count), size=size)
+    buffer = StarMap.make_buffer(size=size)
+    star_map.render_png_bytes(buffer)
+
+    # every star kept past the cull leaves some coverage
+    if len(star_map._r_px) > 0:
+        assert len(star_map._star_rows) > 0
+        assert (star_map._star_trans < 1.0).all()
+
+
+def translucent_map(
+    azimuths: np.ndarray, zeniths: np.ndarray, magnitudes: np.ndarray
+) -> StarMap:
+    star_map = StarMap.from_arrays(azimuths, zeniths, magnitudes, size=8)
+    star_map._star_color = (1.0, 1.0, 0.8, 0.5)
+    star_map._star_bgra = star_map._premultiplied_bgra(star_map._star_color)
+    star_map._make_coverage()
+    return star_map
+
+
+def test_translucent_stars_composite_over(catalog: BrightStarCatalog) -> None:
+    star = catalog.bright_arrays(0, 1)
+    opaque = StarMap.from_arrays(*star, size=8)
+    twice = translucent_map(*(np.repeat(array, 2) for array in star))
+    assert np.array_equal(opaque._star_rows, twice._star_rows)
+    assert np.array_equal(opaque._star_cols, twice._star_cols)
+
+    # the same star drawn over a pixel twice, one over at a time
+    color = twice._star_bgra
+    alpha = twice._star_color[3]
+    coverage = 1.0 - opaque._star_trans
+    trans = 1.0 - (coverage * alpha)
+    assert np.allclose(twice._star_trans, trans * trans)
+    assert np.allclose(
+        twice._star_src, (color * coverage * trans) + (color * coverage)
+    )